@@ -50,7 +50,9 @@ class Data(np.ndarray):
             Data array.
         """
 
-        data = np.asarray(data).view(cls)
+        if not isinstance(data, np.ndarray):
+            data = np.asarray(data)
+        data = data.view(cls)
 
         data.dt = job.dt
         data.profile = job.profile
@@ -362,9 +364,7 @@ class Tiled(Data):
                             tiles[-1, i] = \
                                 utils.array_pad(tile, tile_padding[0], -2, mode='constant', constant_values=constant)
                 else:
-                    for i, tile in enumerate(tiles[-1]):
-                        if tile is not None:
-                            tiles[-1, i] = utils.array_pad(tile, tile_padding[0], -2, **kwargs)
+                    utils.batch_array_pad(tiles[-1], tile_padding[0], -2, **kwargs)
 
             if tile_padding[1] > 0:
                 if (mode in ['reflect', 'symmetric']) and (tiles.shape[1] > 1):
@@ -393,9 +393,7 @@ class Tiled(Data):
                             tiles[i, -1] = \
                                 utils.array_pad(tile, tile_padding[1], -1, mode='constant', constant_values=constant)
                 else:
-                    for i, tile in enumerate(tiles[:, -1]):
-                        if tile is not None:
-                            tiles[i, -1] = utils.array_pad(tile, tile_padding[1], -1, **kwargs)
+                    utils.batch_array_pad(tiles[:, -1], tile_padding[1], -1, **kwargs)
 
             job = Job(self, 'pad_tiles', kwargs)
 
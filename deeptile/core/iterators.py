@@ -1,4 +1,6 @@
 import numpy as np
+from functools import cached_property
+from numpy.lib.stride_tricks import sliding_window_view
 
 
 class Iterator:
@@ -69,6 +71,25 @@ class TileIndicesIterator(Iterator):
 
     """Iterator subclass for tile indices."""
 
+    @cached_property
+    def all_tile_indices(self):
+
+        """Calculate tile indices for all tiles.
+
+        Returns
+        -------
+        all_tile_indices : numpy.ndarray
+            Array of tile indices for all tiles.
+        """
+
+        v_tile_indices, h_tile_indices = self.tiles.tile_indices
+
+        all_tile_indices = np.empty((v_tile_indices.shape[0], h_tile_indices.shape[0], 2, 2), dtype=int)
+        all_tile_indices[:, :, 0] = v_tile_indices[:, None]
+        all_tile_indices[:, :, 1] = h_tile_indices[None]
+
+        return all_tile_indices
+
     def __getitem__(self, index):
 
         """Get tile index.
@@ -85,9 +106,7 @@ class TileIndicesIterator(Iterator):
         """
 
         i, j = index
-        tile_indices = self.tiles.tile_indices
-
-        tile_index = np.stack((tile_indices[0][i], tile_indices[1][j]))
+        tile_index = self.all_tile_indices[i, j]
 
         return tile_index
 
@@ -96,6 +115,28 @@ class BorderIndicesIterator(Iterator):
 
     """Iterator subclass for border indices."""
 
+    @cached_property
+    def all_border_indices(self):
+
+        """Calculate border indices for all tiles.
+
+        Returns
+        -------
+        all_border_indices : numpy.ndarray
+            Array of border indices for all tiles.
+        """
+
+        v_border_indices, h_border_indices = self.tiles.border_indices
+
+        v_windows = sliding_window_view(v_border_indices, 2)
+        h_windows = sliding_window_view(h_border_indices, 2)
+
+        all_border_indices = np.empty((v_windows.shape[0], h_windows.shape[0], 2, 2), dtype=int)
+        all_border_indices[:, :, 0] = v_windows[:, None]
+        all_border_indices[:, :, 1] = h_windows[None]
+
+        return all_border_indices
+
     def __getitem__(self, index):
 
         """Get border index.
@@ -112,9 +153,7 @@ class BorderIndicesIterator(Iterator):
         """
 
         i, j = index
-        border_indices = self.tiles.border_indices
-
-        border_index = np.stack((border_indices[0][i:i + 2], border_indices[1][j:j + 2]))
+        border_index = self.all_border_indices[i, j]
 
         return border_index
 
@@ -123,6 +162,25 @@ class StitchIndicesIterator(Iterator):
 
     """Iterator subclass for stitch indices."""
 
+    @cached_property
+    def all_stitch_indices(self):
+
+        """Calculate stitch indices for all tiles.
+
+        Returns
+        -------
+        all_stitch_indices : tuple of numpy.ndarray
+            Arrays of image and tile stitch indices for all tiles.
+        """
+
+        all_tile_indices = self.tiles.tile_indices_iterator.all_tile_indices
+        all_index_image = self.tiles.border_indices_iterator.all_border_indices
+        all_index_tile = all_index_image - all_tile_indices[:, :, :, 0:1]
+
+        all_stitch_indices = (all_index_image, all_index_tile)
+
+        return all_stitch_indices
+
     def __getitem__(self, index):
 
         """Get stitch index.
@@ -138,11 +196,9 @@ class StitchIndicesIterator(Iterator):
             Stitch index.
         """
 
-        tile_indices_iterator = self.tiles.tile_indices_iterator
-        border_indices_iterator = self.tiles.border_indices_iterator
+        i, j = index
+        all_index_image, all_index_tile = self.all_stitch_indices
 
-        index_image = border_indices_iterator[index]
-        index_tile = index_image - tile_indices_iterator[index][:, 0:1]
-        stitch_index = (*index_image, *index_tile)
+        stitch_index = (*all_index_image[i, j], *all_index_tile[i, j])
 
         return stitch_index
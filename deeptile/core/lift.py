@@ -10,7 +10,7 @@ class Lifted:
 
     """Lifted class for functions lifted to be applied on Tiled objects."""
 
-    def __new__(cls, func, vectorized, batch_axis, pad_final_batch, batch_size):
+    def __new__(cls, func, vectorized, batch_axis, pad_final_batch, batch_size, parallel):
 
         """Lift function.
 
@@ -27,6 +27,9 @@ class Lifted:
             batching, this value is ignored.
         batch_size : int
             Number of tiles in each batch. If ``func`` is not vectorized, this value is ignored.
+        parallel : bool
+            Whether to process tiles in parallel using a shared thread pool. If ``func`` is vectorized, this value is
+            ignored.
 
         Returns
         -------
@@ -41,6 +44,7 @@ class Lifted:
         lifted_func.batch_axis = batch_axis
         lifted_func.pad_final_batch = pad_final_batch
         lifted_func.batch_size = batch_size
+        lifted_func.parallel = parallel
 
         return lifted_func
 
@@ -56,9 +60,12 @@ class Lifted:
 
         processed_tiles, variables = self.init(*args, **kwargs)
 
-        n_steps = variables['n_steps']
-        for _ in range(n_steps):
-            processed_tiles, variables = self.apply(processed_tiles, variables)
+        if self.parallel and not self.vectorized:
+            processed_tiles = self.apply_parallel(processed_tiles, variables)
+        else:
+            n_steps = variables['n_steps']
+            for _ in range(n_steps):
+                processed_tiles, variables = self.apply(processed_tiles, variables)
 
         return processed_tiles
 
@@ -89,6 +96,10 @@ class Lifted:
         job_locals['kwargs'] = trees.tree_apply(kwargs, kwarg_indices, lambda ts: Tiled)
         job = Job(inputs, 'lifted_func', job_locals)
 
+        compiled_args, arg_slots = trees.tree_compile(args, arg_indices)
+        compiled_kwargs, kwarg_slots = trees.tree_compile(kwargs, kwarg_indices)
+        compiled = (compiled_args, arg_slots, compiled_kwargs, kwarg_slots)
+
         reference = tiles[0]
         nonempty_indices = reference.nonempty_indices
         processed_istree = None
@@ -116,6 +127,7 @@ class Lifted:
             'kwargs': kwargs,
             'arg_indices': arg_indices,
             'kwarg_indices': kwarg_indices,
+            'compiled': compiled,
             'job': job,
             'reference': reference,
             'nonempty_indices': nonempty_indices,
@@ -156,6 +168,7 @@ class Lifted:
             kwargs = variables['kwargs']
             arg_indices = variables['arg_indices']
             kwarg_indices = variables['kwarg_indices']
+            compiled = variables['compiled']
             job = variables['job']
             reference = variables['reference']
             nonempty_indices = variables['nonempty_indices']
@@ -165,7 +178,7 @@ class Lifted:
             if self.vectorized:
 
                 batch_axis_len = variables['batch_axis_len']
-                
+
                 batch_offset = step * self.batch_size
                 batch_indices = tuple(i[batch_offset:batch_offset + self.batch_size] for i in nonempty_indices)
 
@@ -173,7 +186,7 @@ class Lifted:
                     process.process_vectorized(self.func, self.batch_axis, self.pad_final_batch, self.batch_size,
                                                args, kwargs, arg_indices, kwarg_indices,
                                                job, reference, batch_axis_len, processed_istree, processed_indices,
-                                               processed_tiles, batch_indices)
+                                               processed_tiles, batch_indices, compiled)
 
             else:
 
@@ -182,7 +195,7 @@ class Lifted:
                     process.process_single(self.func, self.batch_axis,
                                            args, kwargs, arg_indices, kwarg_indices,
                                            job, reference, processed_istree, processed_indices, processed_tiles,
-                                           index)
+                                           index, compiled)
 
             variables['processed_istree'] = processed_istree
             variables['processed_indices'] = processed_indices
@@ -190,8 +203,53 @@ class Lifted:
 
         return processed_tiles, variables
 
+    def apply_parallel(self, processed_tiles, variables):
+
+        """Apply the lifted function on all tiles using a shared thread pool.
+
+        Parameters
+        ----------
+        processed_tiles
+            Tiles processed by lifted function.
+        variables : dict
+            Dictionary of variables used in the lifted job.
+
+        Returns
+        -------
+        processed_tiles
+            Tiles processed by lifted function.
+        """
+
+        args = variables['args']
+        kwargs = variables['kwargs']
+        arg_indices = variables['arg_indices']
+        kwarg_indices = variables['kwarg_indices']
+        job = variables['job']
+        reference = variables['reference']
+        nonempty_indices = variables['nonempty_indices']
+        processed_istree = variables['processed_istree']
+        processed_indices = variables['processed_indices']
+
+        indices = list(zip(*nonempty_indices))
+        arguments = [process.get_arguments(False, 1, args, kwargs, arg_indices, kwarg_indices, index)
+                     for index in indices]
+        results = reference.dt.executor.map(lambda arguments: self.func(*arguments[0], **arguments[1]), arguments)
+
+        for index, processed_tile in zip(indices, results):
+
+            processed_istree, processed_indices, processed_tiles = \
+                process.finalize_single(processed_tile, self.batch_axis,
+                                        job, reference, processed_istree, processed_indices, processed_tiles,
+                                        index)
+
+        variables['processed_istree'] = processed_istree
+        variables['processed_indices'] = processed_indices
+        variables['step'] = variables['n_steps']
+
+        return processed_tiles
+
 
-def lift(func, vectorized=False, batch_axis=False, pad_final_batch=False, batch_size=4):
+def lift(func, vectorized=False, batch_axis=False, pad_final_batch=False, batch_size=4, parallel=False):
 
     """Lift function to be applied on Tiled objects.
 
@@ -208,6 +266,9 @@ def lift(func, vectorized=False, batch_axis=False, pad_final_batch=False, batch_
         this value is ignored.
     batch_size : int, optional, default 4
         Number of tiles in each batch. If ``func`` is not vectorized, this value is ignored.
+    parallel : bool, optional, default False
+        Whether to process tiles in parallel using a shared thread pool. If ``func`` is vectorized, this value is
+        ignored.
 
     Returns
     -------
@@ -215,6 +276,6 @@ def lift(func, vectorized=False, batch_axis=False, pad_final_batch=False, batch_
         Lifted function.
     """
 
-    lifted_func = Lifted(func, vectorized, batch_axis, pad_final_batch, batch_size)
+    lifted_func = Lifted(func, vectorized, batch_axis, pad_final_batch, batch_size, parallel)
 
     return lifted_func
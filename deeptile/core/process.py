@@ -7,7 +7,7 @@ from functools import partial
 def process_vectorized(func, batch_axis, pad_final_batch, batch_size,
                        args, kwargs, arg_indices, kwarg_indices,
                        job, reference, batch_axis_len, processed_istree, processed_indices, processed_tiles,
-                       batch_indices):
+                       batch_indices, compiled=None):
 
     """Process tiles using a vectorized function.
 
@@ -44,6 +44,8 @@ def process_vectorized(func, batch_axis, pad_final_batch, batch_size,
         Tiles processed with ``func``.
     batch_indices : tuple of numpy.ndarray
         Batch indices of tiles.
+    compiled : tuple or None, optional, default None
+        Compiled argument trees and leaf slots created with ``trees.tree_compile``.
 
     Returns
     -------
@@ -55,8 +57,11 @@ def process_vectorized(func, batch_axis, pad_final_batch, batch_size,
         Tiles processed with ``func``.
     """
 
-    batch_args, batch_kwargs = get_arguments(pad_final_batch, batch_size,
-                                             args, kwargs, arg_indices, kwarg_indices, batch_indices)
+    if compiled is None:
+        batch_args, batch_kwargs = get_arguments(pad_final_batch, batch_size,
+                                                 args, kwargs, arg_indices, kwarg_indices, batch_indices)
+    else:
+        batch_args, batch_kwargs = get_arguments_compiled(pad_final_batch, batch_size, *compiled, batch_indices)
     processed_batch_tiles = func(*batch_args, **batch_kwargs)
 
     processed_istree, processed_indices, processed_tiles = \
@@ -64,17 +69,18 @@ def process_vectorized(func, batch_axis, pad_final_batch, batch_size,
 
     processed_batch_tiles = trees.tree_apply(processed_batch_tiles, processed_indices, strip_output_wrapper)
 
-    for i_batch, index in enumerate(zip(*batch_indices)):
-
-        processed_tile = trees.tree_apply(processed_batch_tiles, processed_indices, lambda ts: ts[i_batch])
+    if processed_istree:
+        leaf_tiles = [trees.tree_index(processed_tiles, processed_index)
+                      for processed_index in processed_indices]
+        leaf_batch_tiles = [trees.tree_index(processed_batch_tiles, processed_index)
+                            for processed_index in processed_indices]
+    else:
+        leaf_tiles = [processed_tiles]
+        leaf_batch_tiles = [processed_batch_tiles]
 
-        if processed_istree:
-            for processed_index in processed_indices:
-                update_tiles(trees.tree_index(processed_tiles, processed_index),
-                             trees.tree_index(processed_tile, processed_index),
-                             tuple(index[:2]), batch_axis, batch_axis_len)
-        else:
-            update_tiles(processed_tiles, processed_tile, tuple(index[:2]), batch_axis, batch_axis_len)
+    for i_batch, index in enumerate(zip(*batch_indices)):
+        for tiles, batch_tiles in zip(leaf_tiles, leaf_batch_tiles):
+            update_tiles(tiles, batch_tiles[i_batch], tuple(index[:2]), batch_axis, batch_axis_len)
 
     return processed_istree, processed_indices, processed_tiles
 
@@ -82,7 +88,7 @@ def process_vectorized(func, batch_axis, pad_final_batch, batch_size,
 def process_single(func, batch_axis,
                    args, kwargs, arg_indices, kwarg_indices,
                    job, reference, processed_istree, processed_indices, processed_tiles,
-                   index):
+                   index, compiled=None):
 
     """Process tiles using a function.
 
@@ -112,6 +118,8 @@ def process_single(func, batch_axis,
         Tiles processed with ``func``.
     index : tuple of int
         Index of a tile.
+    compiled : tuple or None, optional, default None
+        Compiled argument trees and leaf slots created with ``trees.tree_compile``.
 
     Returns
     -------
@@ -123,9 +131,55 @@ def process_single(func, batch_axis,
         Tiles processed with ``func``.
     """
 
-    single_args, single_kwargs = get_arguments(False, 1, args, kwargs, arg_indices, kwarg_indices, index)
+    if compiled is None:
+        single_args, single_kwargs = get_arguments(False, 1, args, kwargs, arg_indices, kwarg_indices, index)
+    else:
+        single_args, single_kwargs = get_arguments_compiled(False, 1, *compiled, index)
     processed_tile = func(*single_args, **single_kwargs)
 
+    processed_istree, processed_indices, processed_tiles = \
+        finalize_single(processed_tile, batch_axis,
+                        job, reference, processed_istree, processed_indices, processed_tiles,
+                        index)
+
+    return processed_istree, processed_indices, processed_tiles
+
+
+def finalize_single(processed_tile, batch_axis,
+                    job, reference, processed_istree, processed_indices, processed_tiles,
+                    index):
+
+    """Scatter a processed tile into a Tiled object.
+
+    Parameters
+    ----------
+    processed_tile
+        Processed tile.
+    batch_axis : bool
+        Whether to use the first axis to create batches.
+    job : Job
+        Job associated with this processing step.
+    reference : Tiled
+        Reference array of tiles.
+    processed_istree : bool
+        Whether ``processed_tiles`` is a tree.
+    processed_indices : list of tuple
+        Leaf indices for ``processed_tiles``.
+    processed_tiles
+        Tiles processed with ``func``.
+    index : tuple of int
+        Index of a tile.
+
+    Returns
+    -------
+    processed_istree : bool
+        Whether ``processed_tiles`` is a tree.
+    processed_indices : list of tuple
+        Leaf indices for ``processed_tiles``.
+    processed_tiles
+        Tiles processed with ``func``.
+    """
+
     processed_istree, processed_indices, processed_tiles = \
         initialize_tree(processed_tile, job, reference, processed_istree, processed_indices, processed_tiles)
 
@@ -180,6 +234,44 @@ def get_arguments(pad_final_batch, batch_size, args, kwargs, arg_indices, kwarg_
     return args, kwargs
 
 
+def get_arguments_compiled(pad_final_batch, batch_size, args, arg_slots, kwargs, kwarg_slots, batch_indices):
+
+    """Replace Tiled leaf slots of compiled argument trees with a single tile or batch of tiles.
+
+    Parameters
+    ----------
+    pad_final_batch : bool
+        Whether to pad the final batch to the specified ``batch_size``. If ``func_process`` does not support batching,
+        this value is ignored.
+    batch_size : int
+        Number of tiles in each batch. If ``func`` is not vectorized, this value is ignored.
+    args : tuple
+        Compiled arguments for ``func``.
+    arg_slots : list of tuple
+        Leaf slot references for ``args``.
+    kwargs : dict
+        Compiled keyword arguments for ``func``.
+    kwarg_slots : list of tuple
+        Leaf slot references for ``kwargs``.
+    batch_indices : tuple of numpy.ndarray
+        Batch indices of tiles.
+
+    Returns
+    -------
+    args : tuple
+        Arguments for ``func`` with Tiled objects replaced.
+    kwargs : dict
+        Keyword arguments for ``func`` with Tiled objects replaced.
+    """
+
+    for branch, key, tiles in arg_slots:
+        branch[key] = create_batch(tiles, pad_final_batch, batch_size, batch_indices)
+    for branch, key, tiles in kwarg_slots:
+        branch[key] = create_batch(tiles, pad_final_batch, batch_size, batch_indices)
+
+    return args, kwargs
+
+
 def create_batch(tiles, pad_final_batch, batch_size, batch_indices):
 
     """Create a batch of tiles from a Tiled object.
@@ -214,9 +306,19 @@ def create_batch(tiles, pad_final_batch, batch_size, batch_indices):
     if isinstance(batch_tiles, Tiled):
         batch_tiles = np.asarray(batch_tiles)
     if isinstance(batch_tiles, np.ndarray) and (batch_tiles.dtype is np.dtype('O')) and tiles.metadata['stackable']:
-        batch_tiles = np.stack(batch_tiles)
-        if pad_final_batch and (batch_tiles.shape[0] < batch_size):
-            batch_tiles = utils.array_pad(batch_tiles, batch_size - batch_tiles.shape[0], 0)
+        tile = batch_tiles[0]
+        if isinstance(tile, np.ndarray):
+            n_tiles = len(batch_tiles)
+            n_batch = batch_size if pad_final_batch and (n_tiles < batch_size) else n_tiles
+            batch = np.zeros((n_batch, *tile.shape), dtype=tile.dtype) if n_batch > n_tiles \
+                else np.empty((n_tiles, *tile.shape), dtype=tile.dtype)
+            for n, tile in enumerate(batch_tiles):
+                batch[n] = tile
+            batch_tiles = batch
+        else:
+            batch_tiles = np.stack(batch_tiles)
+            if pad_final_batch and (batch_tiles.shape[0] < batch_size):
+                batch_tiles = utils.array_pad(batch_tiles, batch_size - batch_tiles.shape[0], 0)
 
     return batch_tiles
 
@@ -391,5 +493,5 @@ def check_compatability(tiles):
         if mask is None:
             mask = ts.mask
         else:
-            if np.any(ts.mask != mask):
+            if (ts.mask is not mask) and (not np.array_equal(ts.mask, mask)):
                 raise ValueError(f'tiles must all share a common mask.')
@@ -103,6 +103,59 @@ def tree_apply(tree, leaf_indices, func):
     return tree
 
 
+def tree_compile(tree, leaf_indices):
+
+    """Compile a tree into a mutable copy with references to the given leaf slots.
+
+    Parameters
+    ----------
+    tree
+        Tree object.
+    leaf_indices : list of tuple
+        List of leaf indices.
+
+    Returns
+    -------
+    tree
+        Mutable copy of the tree object.
+    slots : list of tuple
+        List of ``(branch, key, leaf)`` references for the given leaf indices.
+    """
+
+    slots = []
+
+    if _check_istree(tree) and (len(leaf_indices) > 0):
+
+        if isinstance(tree, Sequence):
+            tree = list(tree)
+        elif isinstance(tree, Mapping):
+            tree = dict(tree)
+
+        branch_indices = _get_branches_from_leaves(leaf_indices)
+
+        for branch_index in branch_indices:
+
+            branch = tree_index(tree, branch_index)
+
+            if isinstance(branch, Sequence):
+                tree_replace(tree, branch_index, list(branch))
+            elif isinstance(branch, Mapping):
+                tree_replace(tree, branch_index, dict(branch))
+
+        for leaf_index in leaf_indices:
+
+            branch = tree_index(tree, leaf_index[:-1])
+
+            if isinstance(branch, MutableMapping):
+                key = tuple(branch.keys())[leaf_index[-1]]
+            else:
+                key = leaf_index[-1]
+
+            slots.append((branch, key, tree_index(tree, leaf_index)))
+
+    return tree, slots
+
+
 def tree_replace(tree, index, new_obj):
 
     """Replace a branch or leaf in a tree.
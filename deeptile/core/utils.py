@@ -1,6 +1,7 @@
 import numpy as np
 from collections.abc import Sequence
 from dask.array import Array
+from functools import lru_cache
 
 
 def to_tuple(obj):
@@ -54,17 +55,21 @@ def calculate_overlap_size(tile_size, overlap):
     return overlap_size
 
 
+@lru_cache(maxsize=16)
 def calculate_indices_1d(axis_size, tile_size, overlap):
 
     overlap_size = calculate_overlap_size(tile_size, overlap)
     tiling = calculate_tiling(axis_size, tile_size, overlap_size)
 
-    li = np.arange(tiling) * (tile_size - overlap_size)
-    ri = np.append(li[:-1] + tile_size, axis_size)
-    tile_indices = np.stack((li, ri), axis=1)
+    tile_indices = np.empty((tiling, 2), dtype=int)
+    tile_indices[:, 0] = np.arange(tiling) * (tile_size - overlap_size)
+    tile_indices[:-1, 1] = tile_indices[:-1, 0] + tile_size
+    tile_indices[-1, 1] = axis_size
 
-    border_indices = np.arange(1, tiling) * (tile_size - overlap_size) + round(0.5 * overlap_size)
-    border_indices = np.hstack([0, border_indices, axis_size])
+    border_indices = np.empty(tiling + 1, dtype=int)
+    border_indices[0] = 0
+    border_indices[1:-1] = tile_indices[1:, 0] + round(0.5 * overlap_size)
+    border_indices[-1] = axis_size
 
     return tiling, tile_indices, border_indices
 
@@ -83,25 +88,26 @@ def calculate_indices(image_shape, tile_size, overlap):
 
 def get_nonempty_indices(tiles):
 
-    nonempty_indices = []
+    nonempty_mask = np.frompyfunc(lambda tile: tile is not None, 1, 1)(tiles).astype(bool)
+    nonempty_indices = tuple(map(tuple, np.argwhere(nonempty_mask)))
 
-    for index, tile in np.ndenumerate(tiles):
-        if tile is not None:
-            nonempty_indices.append(index)
+    return nonempty_indices
 
-    nonempty_indices = tuple(nonempty_indices)
 
-    return nonempty_indices
+@lru_cache(maxsize=None)
+def _leading_slices(naxes):
+
+    return (slice(None), ) * naxes
 
 
 def axis_take(ary, axis, index):
 
-    return ary[(slice(None), ) * (axis % ary.ndim) + (index, )]
+    return ary[_leading_slices(axis % ary.ndim) + (index, )]
 
 
 def axis_slice(ary, axis, start, end, step=1):
 
-    return ary[(slice(None), ) * (axis % ary.ndim) + (slice(start, end, step), )]
+    return ary[_leading_slices(axis % ary.ndim) + (slice(start, end, step), )]
 
 
 def array_split(ary, indices, axis):
@@ -113,8 +119,9 @@ def array_split(ary, indices, axis):
 
 def array_split_2d(ary, indices):
 
-    sub_arys = array_split(ary, indices[0], -2)
-    sub_arys = [array_split(sub_ary, indices[1], -1) for sub_ary in sub_arys]
+    v_slices = [slice(i[0], i[1]) for i in indices[0]]
+    h_slices = [slice(i[0], i[1]) for i in indices[1]]
+    sub_arys = [[ary[..., v_slice, h_slice] for h_slice in h_slices] for v_slice in v_slices]
 
     return sub_arys
 
@@ -127,12 +134,27 @@ def array_pad(ary, padding, axis=0, **kwargs):
     return np.pad(ary, pad_width, **kwargs)
 
 
+def batch_array_pad(tiles_1d, padding, axis, **kwargs):
+
+    batch_tiles = [tile for tile in tiles_1d if tile is not None]
+
+    if (len(batch_tiles) > 1) and all(isinstance(tile, np.ndarray) for tile in batch_tiles) \
+            and (len({tile.shape for tile in batch_tiles}) == 1):
+        batch = np.stack(batch_tiles)
+        padded_tiles = iter(array_pad(batch, padding, axis, **kwargs))
+        for i, tile in enumerate(tiles_1d):
+            if tile is not None:
+                tiles_1d[i] = next(padded_tiles)
+    else:
+        for i, tile in enumerate(tiles_1d):
+            if tile is not None:
+                tiles_1d[i] = array_pad(tile, padding, axis, **kwargs)
+
+
 def cast_list_to_array(lst):
 
     ary = np.empty(len(lst), dtype=object)
-
-    for i, subary in enumerate(lst):
-        ary[i] = subary
+    ary[...] = lst
 
     return ary
 
@@ -140,10 +162,7 @@ def cast_list_to_array(lst):
 def cast_list_to_array_2d(lst):
 
     ary = np.empty((len(lst), len(lst[0])), dtype=object)
-
-    for i, sublst in enumerate(lst):
-        for j, subary in enumerate(sublst):
-            ary[i, j] = subary
+    ary[...] = lst
 
     return ary
 
@@ -1,7 +1,10 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 from deeptile.core import utils
 from deeptile.core.data import Tiled
 from deeptile.core.jobs import Job
 from deeptile.core.profiles import Profile
+from functools import cached_property
 
 
 class DeepTile:
@@ -23,6 +26,21 @@ class DeepTile:
         self.link_data = None
         self.profiles = []
 
+    @cached_property
+    def executor(self):
+
+        """Get a shared thread pool executor for parallel tile processing.
+
+        Returns
+        -------
+        executor : ThreadPoolExecutor
+            Shared thread pool executor.
+        """
+
+        executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+        return executor
+
 
 class DeepTileArray(DeepTile):
 
@@ -1,6 +1,7 @@
 import numpy as np
 from deeptile.core.data import Stitched
 from deeptile.core.jobs import Job
+from deeptile.core.utils import compute_dask
 
 
 def stitch_image(tiles, blend=True, sigma=10):
@@ -47,15 +48,16 @@ def stitch_image(tiles, blend=True, sigma=10):
 
             tile_index = tile_indices_iterator[index]
 
-            tile = tiles[index]
+            tile = compute_dask(tiles[index])
             stitch_slice = np.s_[..., tile_index[0, 0]:tile_index[0, 1],
                                  tile_index[1, 0]:tile_index[1, 1]]
             tile_slice = np.s_[..., :tile_index[0, 1] - tile_index[0, 0],
                                     :tile_index[1, 1] - tile_index[1, 0]]
-            stitched[stitch_slice] = stitched[stitch_slice] + tile[tile_slice] * taper[tile_slice]
-            avg[stitch_slice[1:]] = avg[stitch_slice[1:]] + taper[tile_slice]
+            stitched[stitch_slice] += tile[tile_slice] * taper[tile_slice]
+            avg[stitch_slice[1:]] += taper[tile_slice]
 
-        stitched = stitched / (avg + 1e-7)
+        avg += 1e-7
+        stitched /= avg
         stitched = stitched.astype(dtype)
 
     else:
@@ -152,7 +154,8 @@ def stitch_masks(masks, iou_threshold=0.1):
     stitch_indices_iterator = masks.stitch_indices_iterator
     mask_shape = (*first_mask.shape[:-2], *masks.image_size[-2:])
     mask_flat_shape = (np.prod(mask_shape[:-2], dtype=int), *mask_shape[-2:])
-    stitched_mask = np.zeros(mask_flat_shape, dtype=int)
+    stitched_mask = np.zeros(mask_flat_shape, dtype=np.int32)
+    mask_buf = np.empty(masks.tile_size, dtype=first_mask.dtype)
 
     for z in range(mask_flat_shape[0]):
 
@@ -167,15 +170,17 @@ def stitch_masks(masks, iou_threshold=0.1):
 
             mask = masks[index]
             mask = mask.reshape(-1, *mask.shape[-2:])
-            mask = mask[z].copy()
-            mask = _clear_border(mask, i_clear, j_clear)
+            mask = mask[z]
+            mask_copy = mask_buf[:mask.shape[-2], :mask.shape[-1]]
+            np.copyto(mask_copy, mask)
+            mask = _clear_border(mask_copy, i_clear, j_clear)
 
             mask_crop = mask[i_tile[0]:i_tile[1], j_tile[0]:j_tile[1]]
             mask_crop = measure.label(mask_crop)
             count = mask_crop.max()
-            mask_crop[mask_crop > 0] += total_count
+            stitched_crop = stitched_mask[z, i_image[0]:i_image[1], j_image[0]:j_image[1]]
+            np.add(mask_crop, total_count, out=stitched_crop, where=mask_crop > 0)
             total_count += count
-            stitched_mask[z, i_image[0]:i_image[1], j_image[0]:j_image[1]] = mask_crop
 
         border_blobs = _find_border_blobs(masks, tile_indices, border_indices, z)
 
@@ -186,13 +191,11 @@ def stitch_masks(masks, iou_threshold=0.1):
             mask = masks[index]
             mask = mask.reshape(-1, *mask.shape[-2:])
             mask = mask[z]
-            regions = measure.regionprops(mask)
-            regions = {region.label: region for region in regions}
+            regions = {region.label: (region.image, region.slice) for region in measure.regionprops(mask)}
 
             for blob in blobs:
 
-                mask_crop = regions[blob].image
-                s = regions[blob].slice
+                mask_crop, s = regions[blob]
                 s_image = (slice(s[0].start + tile_index[0, 0],
                                  s[0].stop + tile_index[0, 0]),
                            slice(s[1].start + tile_index[1, 0],
@@ -359,67 +362,69 @@ def _calculate_iou_score(a, b):
 
 def _find_border_blobs(masks, tile_indices, border_indices, z):
 
-    tile_indices_flat = (tile_indices[0].ravel(), tile_indices[1].ravel())
     border_blobs = dict()
 
     for axis in range(2):
 
-        if axis == 1:
-            masks = masks.T
+        i_image_all = np.stack((border_indices[axis][:-1], border_indices[axis][1:]), axis=1)
+        i_tile_all = i_image_all - tile_indices[axis][:, 0:1]
+
+        j_tile_indices = tile_indices[1 - axis]
+        j_image_all = np.stack((j_tile_indices[1:, 0], j_tile_indices[:-1, 1]), axis=1)
+        j_offset_all = np.stack((j_tile_indices[:-1, 0], j_tile_indices[1:, 0]), axis=1)
+        j_tile_all = j_image_all[:, None, :] - j_offset_all[:, :, None]
+        border_index_all = border_indices[1 - axis][1:-1] - j_image_all[:, 0]
 
-        for i in range(masks.shape[0]):
+        for i in range(masks.shape[axis]):
 
-            i_image = border_indices[axis][i:i + 2]
-            i_tile = i_image - tile_indices[axis][i, 0]
+            i_tile = i_tile_all[i]
 
-            for j in range(masks.shape[1] - 1):
+            for j in range(masks.shape[1 - axis] - 1):
 
-                j_image = np.flip(tile_indices_flat[1 - axis][2 * j + 1:2 * j + 3])
-                offset = tile_indices[1 - axis][j:j + 2, 0]
-                j_tile = j_image - offset.reshape(2, 1)
-                border_index = border_indices[1 - axis][j + 1] - j_image[0]
+                j_tile = j_tile_all[j]
+                border_index = border_index_all[j]
 
-                position_l, position_r = None, None
+                if axis == 0:
+                    position_l, position_r = (i, j), (i, j + 1)
+                else:
+                    position_l, position_r = (j, i), (j + 1, i)
 
-                mask_l_all = masks[i, j]
+                mask_l_all = masks[position_l]
                 if mask_l_all is not None:
                     mask_l_all = mask_l_all.reshape(-1, *mask_l_all.shape[-2:])
                     mask_l_all = mask_l_all[z]
-                    if axis == 1:
-                        mask_l_all = mask_l_all.T
-                        position_l = (j, i)
-                    elif axis == 0:
-                        position_l = (i, j)
-                    border_blobs = _scan_border(border_blobs, mask_l_all, (i_tile, j_tile[0]), position_l, border_index)
-
-                mask_r_all = masks[i, j + 1]
+                    border_blobs = _scan_border(border_blobs, mask_l_all, (i_tile, j_tile[0]), position_l, border_index,
+                                                axis)
+
+                mask_r_all = masks[position_r]
                 if mask_r_all is not None:
                     mask_r_all = mask_r_all.reshape(-1, *mask_r_all.shape[-2:])
                     mask_r_all = mask_r_all[z]
-                    if axis == 1:
-                        mask_r_all = mask_r_all.T
-                        position_r = (j + 1, i)
-                    elif axis == 0:
-                        position_r = (i, j + 1)
-                    border_blobs = _scan_border(border_blobs, mask_r_all, (i_tile, j_tile[1]), position_r, border_index)
+                    border_blobs = _scan_border(border_blobs, mask_r_all, (i_tile, j_tile[1]), position_r, border_index,
+                                                axis)
+
+    border_blobs = {position: np.unique(np.concatenate(blobs))
+                    for position, blobs in border_blobs.items()}
 
     return border_blobs
 
 
-def _scan_border(all_border_blobs, mask_all, position, position_adjacent, border_index):
+def _scan_border(all_border_blobs, mask_all, position, position_adjacent, border_index, axis):
 
     if mask_all is not None:
 
         i, j = position
-        mask = mask_all[i[0]:i[1], j[0]:j[1]]
-        border = mask[:, border_index]
-        blobs = np.unique(border)
-        blobs = blobs[blobs > 0]
+        if axis == 0:
+            border = mask_all[i[0]:i[1], j[0]:j[1]][:, border_index]
+        else:
+            border = mask_all[j[0]:j[1], i[0]:i[1]][border_index]
+        present = np.zeros(int(border.max(initial=0)) + 1, dtype=bool)
+        present[border] = True
+        present[0] = False
+        blobs = np.flatnonzero(present)
 
         if len(blobs) > 0:
-            border_blobs = all_border_blobs.get(position_adjacent, set())
-            border_blobs.update(blobs)
-            all_border_blobs[position_adjacent] = border_blobs
+            all_border_blobs.setdefault(position_adjacent, []).append(blobs)
 
     return all_border_blobs
 
@@ -1,16 +1,16 @@
 import dask.array as da
+import math
 import numpy as np
 from dask import delayed
-from deeptile.core import utils
 
 
 def parse(image, image_shape, tile_size, overlap, slices):
 
-    overlap_size = utils.calculate_overlap_size(np.array(tile_size), np.array(overlap))
-    tiling = utils.calculate_tiling(np.array(image_shape), np.array(tile_size), overlap_size)
-    tiling = tuple(tiling)
-    tile_size = np.ceil(tile_size)
-    overlap_size = np.floor(overlap_size)
+    overlap_size = (round(tile_size[0] * overlap[0]), round(tile_size[1] * overlap[1]))
+    tiling = (math.ceil((image_shape[0] - overlap_size[0]) / (tile_size[0] - overlap_size[0])),
+              math.ceil((image_shape[1] - overlap_size[1]) / (tile_size[1] - overlap_size[1])))
+    tile_size = (math.ceil(tile_size[0]), math.ceil(tile_size[1]))
+    overlap_size = (math.floor(overlap_size[0]), math.floor(overlap_size[1]))
 
     tiles = np.empty(tiling, dtype=object)
     gys = []
@@ -26,23 +26,22 @@ def parse(image, image_shape, tile_size, overlap, slices):
         delayed_reader = lazy_imread(tile_dict)
         shape = (tile_dict['height'], tile_dict['width'])
         tiles[tile_dict['level_y'], tile_dict['level_x']] = da.from_delayed(delayed_reader, shape=shape, dtype=object)
-        gys.append(tile_dict['gy'])
-        gxs.append(tile_dict['gx'])
-        heights.append(tile_dict['height'])
-        widths.append(tile_dict['width'])
-
-    gys = gys[::tiling[1]]
-    gxs = gxs[:tiling[1]]
-    heights = heights[::tiling[1]]
-    widths = widths[:tiling[1]]
-
-    v_tile_indices = np.cumsum((gys, heights), axis=0).T.astype(int)
-    h_tile_indices = np.cumsum((gxs, widths), axis=0).T.astype(int)
+        if tile_dict['level_x'] == 0:
+            gys.append(tile_dict['gy'])
+            heights.append(tile_dict['height'])
+        if tile_dict['level_y'] == 0:
+            gxs.append(tile_dict['gx'])
+            widths.append(tile_dict['width'])
+
+    gys = np.asarray(gys)
+    gxs = np.asarray(gxs)
+    v_tile_indices = np.stack((gys, gys + heights), axis=1).astype(int)
+    h_tile_indices = np.stack((gxs, gxs + widths), axis=1).astype(int)
     tile_indices = (v_tile_indices, h_tile_indices)
 
-    v_border_indices = np.mean(v_tile_indices.ravel()[1:-1].reshape(-1, 2), axis=1).astype(int)
+    v_border_indices = (v_tile_indices[:-1, 1] + v_tile_indices[1:, 0]) // 2
     v_border_indices = np.concatenate(([0], v_border_indices, [image_shape[0]]))
-    h_border_indices = np.mean(h_tile_indices.ravel()[1:-1].reshape(-1, 2), axis=1).astype(int)
+    h_border_indices = (h_tile_indices[:-1, 1] + h_tile_indices[1:, 0]) // 2
     h_border_indices = np.concatenate(([0], h_border_indices, [image_shape[1]]))
     border_indices = (v_border_indices, h_border_indices)
 
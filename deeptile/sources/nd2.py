@@ -1,6 +1,7 @@
 import nd2
 import numpy as np
 from collections import OrderedDict
+from deeptile.core import utils
 
 AXIS_ORDER = ('P', 'T', 'Z', 'C', 'S', 'Y', 'X')
 
@@ -28,6 +29,10 @@ def parse(image, dask, axis_sizes, axis_order, overlap, slices):
         image_array = np.moveaxis(image_array,
                                   range(len(raw_axis_order)), (axis_order.index(axis) for axis in raw_axis_order))
 
+        attributes = image.attributes
+        width_px = attributes.widthPx
+        height_px = attributes.heightPx
+
         if 'P' not in axis_order:
 
             tiles = np.empty((1, 1), dtype=object)
@@ -45,55 +50,49 @@ def parse(image, dask, axis_sizes, axis_order, overlap, slices):
                     positions = np.array([point.stagePositionUm[:2] for point in loop.parameters.points]).T
                     break
 
-            camera_transformation = np.array(image.metadata.channels[0].volume.cameraTransformationMatrix).reshape(2, 2)
+            volume = image.metadata.channels[0].volume
+            camera_transformation = np.array(volume.cameraTransformationMatrix).reshape(2, 2)
 
             x, y = np.linalg.inv(camera_transformation) @ positions
 
-            if positions[0, 1] - positions[0, 0] > 0:
-                x = -x
-            if positions[1, -1] - positions[1, 0] > 0:
-                y = -y
+            x *= 1 - 2 * (positions[0, 1] > positions[0, 0])
+            y *= 1 - 2 * (positions[1, -1] > positions[1, 0])
+
+            x_ptp = np.ptp(x)
+            y_ptp = np.ptp(y)
+            step = abs(x[0] - x[1])
 
-            x_ndim = round(np.ptp(x) / abs(x[0] - x[1])) + 1
-            y_ndim = round(np.ptp(y) / abs(x[0] - x[1])) + 1
+            x_ndim = round(x_ptp / step) + 1
+            y_ndim = round(y_ptp / step) + 1
 
-            j = np.rint((x - min(x)) / (np.ptp(x) / (x_ndim - 1))).astype(int)
-            i = np.rint((y - min(y)) / (np.ptp(y) / (y_ndim - 1))).astype(int)
+            j = np.rint((x - x.min()) / (x_ptp / (x_ndim - 1))).astype(int)
+            i = np.rint((y - y.min()) / (y_ptp / (y_ndim - 1))).astype(int)
 
             if overlap is None:
-                x_overlaps = np.empty(0)
-                y_overlaps = np.empty(0)
-                for col in np.unique(j):
-                    x_overlaps = np.append(x_overlaps, np.mean(x[np.where(j == col)]))
-                for row in np.unique(i):
-                    y_overlaps = np.append(y_overlaps, np.mean(y[np.where(i == row)]))
-                x_overlap = round(1 - (np.mean(np.diff(x_overlaps)) / image.metadata.channels[0].volume.axesCalibration[
-                    0]) / image.attributes.widthPx, 2)
-                y_overlap = round(1 - (np.mean(np.diff(y_overlaps)) / image.metadata.channels[0].volume.axesCalibration[
-                    1]) / image.attributes.heightPx, 2)
+                x_overlaps = np.bincount(j, weights=x) / np.bincount(j)
+                y_overlaps = np.bincount(i, weights=y) / np.bincount(i)
+                axes_calibration = volume.axesCalibration
+                x_overlap = round(1 - (np.mean(np.diff(x_overlaps)) / axes_calibration[0]) / width_px, 2)
+                y_overlap = round(1 - (np.mean(np.diff(y_overlaps)) / axes_calibration[1]) / height_px, 2)
 
                 if not ((0 < x_overlap < 1) & (0 < y_overlap < 1)):
                     raise RuntimeError("failed to determine overlap percentage from metadata.")
 
                 overlap = (y_overlap, x_overlap)
 
-            width = x_ndim * image.attributes.widthPx - (x_ndim - 1) * round(image.attributes.widthPx * overlap[1])
-            height = y_ndim * image.attributes.heightPx - (y_ndim - 1) * round(image.attributes.heightPx * overlap[0])
+            width = x_ndim * width_px - (x_ndim - 1) * round(width_px * overlap[1])
+            height = y_ndim * height_px - (y_ndim - 1) * round(height_px * overlap[0])
 
-            image_shape = None
-            tiles = np.empty((y_ndim, x_ndim), dtype=object)
+            if image_array.ndim > 3:
+                image_array = image_array[(slice(None), ) + utils.to_tuple(slices)]
+            p_tiles = list(image_array)
+            image_shape = (*p_tiles[0].shape[:-2], height, width)
 
-            for n in range(axis_sizes['P']):
-
-                tile = image_array[n]
-                if tile.ndim > 2:
-                    tile = tile[slices]
-                if image_shape is None:
-                    image_shape = (*tile.shape[:-2], height, width)
-                tiles[i[n], j[n]] = tile
+            tiles = np.empty((y_ndim, x_ndim), dtype=object)
+            tiles[i, j] = p_tiles
 
             tiling = tiles.shape
 
-        tile_size = (image.attributes.heightPx, image.attributes.widthPx)
+        tile_size = (height_px, width_px)
 
     return tiles, tiling, tile_size, overlap, image_shape
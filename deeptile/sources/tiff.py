@@ -10,6 +10,9 @@ def read(image, dask):
         image = tifffile.memmap(image)
         image = da.from_delayed(delayed_reader, shape=image.shape, dtype=image.dtype)
     else:
-        image = tifffile.imread(image)
+        try:
+            image = tifffile.memmap(image, mode='r')
+        except ValueError:
+            image = tifffile.imread(image)
 
     return image
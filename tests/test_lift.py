@@ -0,0 +1,18 @@
+def test_lift_parallel():
+
+    """ Test that lifted functions produce identical results in parallel. """
+
+    import numpy as np
+    from deeptile import load
+    from deeptile.core.lift import lift
+
+    image = np.random.rand(4, 1022, 1024)
+    dt = load(image, dask=False)
+    tiles = dt.get_tiles(tile_size=(300, 300))
+
+    func = lambda tile: tile * 2
+    expected = lift(func)(tiles)
+    parallel = lift(func, parallel=True)(tiles)
+
+    for index in expected.nonempty_indices_tuples:
+        assert np.all(parallel[index] == expected[index])